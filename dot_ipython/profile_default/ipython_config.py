@@ -15,54 +15,71 @@ _PINE   = "#31748f"
 _FOAM   = "#9ccfd8"
 _IRIS   = "#c4a7e7"
 
+# Composite styles, built once and shared by every token that uses them
+_IT_MUTED   = f"italic {_MUTED}"
+_IT_LOVE    = f"italic {_LOVE}"
+_IT_GOLD    = f"italic {_GOLD}"
+_IT_ROSE    = f"italic {_ROSE}"
+_IT_PINE    = f"italic {_PINE}"
+_IT_FOAM    = f"italic {_FOAM}"
+_IT_IRIS    = f"italic {_IRIS}"
+_BD_SUBTLE  = f"bold {_SUBTLE}"
+_BD_TEXT    = f"bold {_TEXT}"
+_BD_LOVE    = f"bold {_LOVE}"
+_BD_GOLD    = f"bold {_GOLD}"
+_BD_PINE    = f"bold {_PINE}"
+_BD_FOAM    = f"bold {_FOAM}"
+_BD_IRIS    = f"bold {_IRIS}"
+_BD_IT_LOVE = f"bold italic {_LOVE}"
+
 theme_table["rose-pine"] = Theme(
     "rose-pine",
     base=None,
     extra_style={
         Token:                      _TEXT,
-        Comment:                    f"italic {_MUTED}",
-        Keyword:                    f"italic {_LOVE}",
-        Keyword.Constant:           f"italic {_IRIS}",
-        Keyword.Declaration:        f"italic {_LOVE}",
+        Comment:                    _IT_MUTED,
+        Keyword:                    _IT_LOVE,
+        Keyword.Constant:           _IT_IRIS,
+        Keyword.Declaration:        _IT_LOVE,
         Keyword.Namespace:          _FOAM,
-        Keyword.Type:               f"italic {_GOLD}",
+        Keyword.Type:               _IT_GOLD,
         Name:                       _TEXT,
         Name.Attribute:             _ROSE,
         Name.Builtin:               _FOAM,
-        Name.Builtin.Pseudo:        f"italic {_FOAM}",
+        Name.Builtin.Pseudo:        _IT_FOAM,
         Name.Class:                 _FOAM,
         Name.Decorator:             _IRIS,
         Name.Exception:             _LOVE,
-        Name.Function:              f"italic {_PINE}",
-        Name.Function.Magic:        f"italic {_PINE}",
+        Name.Function:              _IT_PINE,
+        Name.Function.Magic:        _IT_PINE,
         Number:                     _GOLD,
-        Operator:                   f"bold {_FOAM}",
-        Operator.Word:              f"bold italic {_LOVE}",
+        Operator:                   _BD_FOAM,
+        Operator.Word:              _BD_IT_LOVE,
         Punctuation:                _SUBTLE,
         String:                     _PINE,
-        String.Doc:                 f"italic {_MUTED}",
+        String.Doc:                 _IT_MUTED,
         String.Escape:              _ROSE,
         String.Interpol:            _ROSE,
         Error:                      _LOVE,
         Generic.Deleted:            _LOVE,
-        Generic.Emph:               f"italic {_ROSE}",
+        Generic.Emph:               _IT_ROSE,
         Generic.Error:              _LOVE,
-        Generic.Heading:            f"bold {_PINE}",
+        Generic.Heading:            _BD_PINE,
         Generic.Inserted:           _PINE,
-        Generic.Strong:             f"bold {_TEXT}",
-        Generic.Subheading:         f"bold {_IRIS}",
+        Generic.Strong:             _BD_TEXT,
+        Generic.Subheading:         _BD_IRIS,
         Generic.Traceback:          _LOVE,
         Token.Prompt:               _PINE,
-        Token.PromptNum:            f"bold {_FOAM}",
+        Token.PromptNum:            _BD_FOAM,
         Token.OutPrompt:            _IRIS,
-        Token.OutPromptNum:         f"bold {_IRIS}",
+        Token.OutPromptNum:         _BD_IRIS,
         Token.Lineno:               _SUBTLE,
-        Token.LinenoEm:             f"bold {_SUBTLE}",
-        Token.ValEm:                f"bold {_GOLD}",
+        Token.LinenoEm:             _BD_SUBTLE,
+        Token.ValEm:                _BD_GOLD,
         Token.VName:                _ROSE,
         Token.Filename:             _FOAM,
-        Token.FilenameEm:           f"bold {_FOAM}",
-        Token.ExcName:              f"bold {_LOVE}",
+        Token.FilenameEm:           _BD_FOAM,
+        Token.ExcName:              _BD_LOVE,
         Token.Topline:              _SUBTLE,
         Token.Caret:                "",
     },